@@ -1,13 +1,21 @@
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel
-from typing import Dict, List, Optional
-import requests
-import pandas as pd
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+from contextlib import asynccontextmanager
+import asyncio
+import functools
+import hashlib
+import os
+import sqlite3
+import threading
+import httpx
+import redis.asyncio as aioredis
 import re
-import spacy
-from collections import Counter
-import json
+from collections import Counter, OrderedDict
+import orjson
+from cachetools import TTLCache
 import logging
 
 # Configure logging with more detailed format
@@ -18,12 +26,64 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Shared async client for GitHub API calls
+# Created once at startup so pooled TCP/TLS connections are reused across requests,
+# and HTTP/2 multiplexes concurrent requests over a single connection
+github_client: Optional[httpx.AsyncClient] = None
+
+# Analysis results are shared through Redis when REDIS_URL is set, so every
+# uvicorn worker sees the same data; otherwise they are kept in process memory
+REDIS_URL = os.getenv("REDIS_URL")
+redis_client: Optional[aioredis.Redis] = None
+
+# ETag cache for GitHub responses: a bounded in-memory LRU in front of a
+# capped SQLite table, so hot entries skip the disk and the cache survives restarts
+ETAG_CACHE_PATH = os.getenv("ETAG_CACHE_PATH", "github_etags.sqlite3")
+ETAG_MEMORY_CACHE_SIZE = 1000  # Maximum number of responses kept in memory
+ETAG_DB_MAX_ENTRIES = 10000  # Maximum number of responses kept in SQLite
+etag_db: Optional[sqlite3.Connection] = None
+# The connection is shared by worker threads, so queries take turns
+etag_db_lock = threading.Lock()
+etag_memory_cache: "OrderedDict[str, Tuple[str, Optional[str], bytes]]" = OrderedDict()
+
+def open_etag_db(path: str) -> sqlite3.Connection:
+    """Open the SQLite ETag cache, creating its table if needed"""
+    db = sqlite3.connect(path, check_same_thread=False)
+    db.execute(
+        "CREATE TABLE IF NOT EXISTS etag_responses "
+        "(url TEXT PRIMARY KEY, etag TEXT NOT NULL, link TEXT, body BLOB NOT NULL)"
+    )
+    db.commit()
+    return db
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Open shared GitHub, Redis and ETag cache clients on startup and close them on shutdown"""
+    global github_client, redis_client, etag_db
+    github_client = httpx.AsyncClient(
+        http2=True,
+        timeout=10,
+        headers={"Accept": "application/vnd.github.v3+json", "User-Agent": "CommitFit/1.0"},
+        limits=httpx.Limits(max_connections=20, max_keepalive_connections=20)
+    )
+    if REDIS_URL:
+        redis_client = aioredis.from_url(REDIS_URL, decode_responses=True)
+        logger.info("Storing analysis results in Redis")
+    etag_db = open_etag_db(ETAG_CACHE_PATH)
+    yield
+    await github_client.aclose()
+    etag_db.close()
+    if redis_client is not None:
+        await redis_client.aclose()
+
 app = FastAPI(
     title="CommitFit API",
     version="1.1.0",
     description="API for analyzing GitHub profiles and matching them with job requirements",
     docs_url="/docs",
-    redoc_url="/redoc"
+    redoc_url="/redoc",
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan
 )
 
 # CORS middleware for frontend communication
@@ -36,13 +96,31 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# Load spaCy model for NLP
+# pyahocorasick is optional, skill matching falls back to a compiled regex without it
 try:
-    nlp = spacy.load("en_core_web_sm")
-    logger.info("spaCy model loaded successfully")
-except OSError:
-    logger.warning("Please install spaCy model: python -m spacy download en_core_web_sm")
-    nlp = None
+    import ahocorasick
+except ImportError:
+    logger.warning("pyahocorasick not installed, using regex keyword matching")
+    ahocorasick = None
+
+# Load spaCy model for NLP
+# Nothing in the request path needs it, so it is loaded on first use instead
+# of at startup; only the tokenizer is kept, the statistical components are
+# excluded to save memory
+@functools.lru_cache(maxsize=None)
+def _get_nlp():
+    """Load the spaCy model once, returning None if it is not installed"""
+    import spacy
+    try:
+        nlp = spacy.load(
+            "en_core_web_sm",
+            exclude=["tok2vec", "tagger", "parser", "attribute_ruler", "lemmatizer", "ner"]
+        )
+        logger.info("spaCy model loaded successfully")
+        return nlp
+    except OSError:
+        logger.warning("Please install spaCy model: python -m spacy download en_core_web_sm")
+        return None
 
 # Pydantic models
 class GitHubAnalysisRequest(BaseModel):
@@ -78,51 +156,314 @@ class MatchReport(BaseModel):
     job_skills: List[str]
     repo_insights: Dict
 
+# GitHub GraphQL endpoint and query used to fetch repositories with their languages
+GITHUB_GRAPHQL_URL = "https://api.github.com/graphql"
+USER_REPOS_QUERY = """
+query($login: String!, $cursor: String) {
+  repositoryOwner(login: $login) {
+    repositories(first: 100, after: $cursor, privacy: PUBLIC, ownerAffiliations: OWNER) {
+      pageInfo { hasNextPage endCursor }
+      nodes {
+        name
+        description
+        stargazerCount
+        forkCount
+        diskUsage
+        repositoryTopics(first: 20) { nodes { topic { name } } }
+        languages(first: 20, orderBy: {field: SIZE, direction: DESC}) {
+          totalSize
+          edges { size node { name } }
+        }
+      }
+    }
+  }
+}
+"""
+
+# Repository fields used by the analysis; everything else GitHub returns
+# (owner, permissions, dozens of *_url templates) is dropped right after parsing
+REPO_FIELDS = ('name', 'description', 'stargazers_count', 'forks_count', 'size', 'topics', 'languages_url')
+
+# Maximum number of GitHub requests one analysis keeps in flight at once
+MAX_CONCURRENT_GITHUB_REQUESTS = 10
+
 # GitHub API functions
-def fetch_user_repos(username: str, github_token: Optional[str] = None) -> List[Dict]:
-    """Fetch public repositories for a GitHub user
+def _project_repo_page(content: bytes) -> bytes:
+    """Reduce a raw repository list body to REPO_FIELDS before it is cached
+    
+    GitHub sends about 5 KB per repository, almost all of it unused.
+    """
+    return orjson.dumps([
+        {field: repo[field] for field in REPO_FIELDS if field in repo}
+        for repo in orjson.loads(content)
+    ])
+
+def _parse_repo_page(response: httpx.Response) -> List[Dict]:
+    """Check a repository list response and keep only REPO_FIELDS of each repo
+    
+    Raises:
+        HTTPException: If the rate limit is exceeded
+        httpx.HTTPStatusError: If GitHub answered with another error
+    """
+    if response.status_code == 403:
+        error_data = orjson.loads(response.content)
+        if "rate limit" in error_data.get("message", "").lower():
+            raise HTTPException(
+                status_code=429, 
+                detail="GitHub API rate limit exceeded. Please try again in a few minutes or use GitHub authentication for higher limits."
+            )
+    response.raise_for_status()
+    return [
+        {field: repo[field] for field in REPO_FIELDS if field in repo}
+        for repo in orjson.loads(response.content)
+    ]
+
+async def fetch_user_repos(username: str, github_token: Optional[str] = None) -> List[Dict]:
+    """Fetch all public repositories for a GitHub user, following pagination
     
     Args:
         username: GitHub username to fetch repositories for
         github_token: Optional GitHub personal access token for higher rate limits
         
     Returns:
-        List of repository dictionaries from GitHub API
+        List of repository dictionaries from GitHub API, limited to REPO_FIELDS
         
     Raises:
         HTTPException: If the request fails or rate limit is exceeded
     """
     url = f"https://api.github.com/users/{username}/repos"
-    headers = {"Accept": "application/vnd.github.v3+json"}
+    # GitHub returns 30 repos per page by default; ask for the maximum
+    params = {"per_page": 100, "sort": "pushed"}
+    headers = {}
     
     # Add authentication if token is provided
     if github_token:
         headers["Authorization"] = f"token {github_token}"
     
-    # Add User-Agent header (GitHub API best practice)
-    headers["User-Agent"] = "CommitFit/1.1.0"
+    try:
+        # Unchanged pages are answered from the ETag cache
+        response = await cached_get(url, headers, params, project=_project_repo_page)
+        repos = _parse_repo_page(response)
+        
+        # The first page's Link header gives the URL of the last page, so the
+        # remaining pages are fetched concurrently instead of one after another
+        last_url = response.links.get('last', {}).get('url')
+        last_url = httpx.URL(last_url) if last_url else None
+        last_page = last_url.params.get('page', '') if last_url else ''
+        if last_page.isdigit():
+            semaphore = asyncio.Semaphore(MAX_CONCURRENT_GITHUB_REQUESTS)
+            
+            async def fetch_page(page: int) -> List[Dict]:
+                async with semaphore:
+                    page_url = str(last_url.copy_set_param('page', page))
+                    return _parse_repo_page(await cached_get(page_url, headers, project=_project_repo_page))
+            
+            pages = await asyncio.gather(*(fetch_page(page) for page in range(2, int(last_page) + 1)))
+            for page_repos in pages:
+                repos.extend(page_repos)
+        else:
+            # Without a usable last page, follow the next links one by one
+            next_url = response.links.get('next', {}).get('url')
+            while next_url:
+                response = await cached_get(next_url, headers, project=_project_repo_page)
+                repos.extend(_parse_repo_page(response))
+                next_url = response.links.get('next', {}).get('url')
+    except httpx.TimeoutException:
+        raise HTTPException(status_code=408, detail="Request to GitHub API timed out. Please try again.")
+    except httpx.HTTPError as e:
+        raise HTTPException(status_code=400, detail=f"GitHub API error: {str(e)}")
     
+    return repos
+
+def _remember_response(url: str, entry: Tuple[str, Optional[str], bytes]) -> None:
+    """Put a cached response in the in-memory LRU, evicting the oldest entry"""
+    etag_memory_cache[url] = entry
+    etag_memory_cache.move_to_end(url)
+    if len(etag_memory_cache) > ETAG_MEMORY_CACHE_SIZE:
+        etag_memory_cache.popitem(last=False)
+
+def _read_etag_db(url: str) -> Optional[Tuple[str, Optional[str], bytes]]:
+    """Load a cached entry from SQLite (blocking, run in a worker thread)"""
+    with etag_db_lock:
+        row = etag_db.execute("SELECT etag, link, body FROM etag_responses WHERE url = ?", (url,)).fetchone()
+    return (row[0], row[1], row[2]) if row is not None else None
+
+def _write_etag_db(url: str, entry: Tuple[str, Optional[str], bytes]) -> None:
+    """Save a cached entry to SQLite (blocking, run in a worker thread)"""
+    with etag_db_lock:
+        # REPLACE gives the row a new, highest rowid, so the lowest rowids
+        # are the least recently written entries and are pruned first
+        etag_db.execute("INSERT OR REPLACE INTO etag_responses VALUES (?, ?, ?, ?)", (url, *entry))
+        etag_db.execute(
+            "DELETE FROM etag_responses WHERE rowid <= (SELECT MAX(rowid) FROM etag_responses) - ?",
+            (ETAG_DB_MAX_ENTRIES,)
+        )
+        etag_db.commit()
+
+async def _get_cached_response(url: str) -> Optional[Tuple[str, Optional[str], bytes]]:
+    """Look up a cached (etag, link header, body) entry, memory first"""
+    entry = etag_memory_cache.get(url)
+    if entry is not None:
+        etag_memory_cache.move_to_end(url)
+        return entry
+    try:
+        entry = await asyncio.to_thread(_read_etag_db, url)
+    except sqlite3.Error as e:
+        # e.g. "database is locked" when several workers share the file;
+        # the cache is only an optimization, so treat it as a miss
+        logger.warning(f"ETag cache read failed for {url}: {e}")
+        return None
+    if entry is not None:
+        _remember_response(url, entry)
+    return entry
+
+async def _store_cached_response(url: str, entry: Tuple[str, Optional[str], bytes]) -> None:
+    """Save a response in both the in-memory LRU and SQLite"""
+    _remember_response(url, entry)
     try:
-        # Add User-Agent header to comply with GitHub API best practices
-        headers["User-Agent"] = "CommitFit/1.0"
-        response = requests.get(url, headers=headers, timeout=10)
-        if response.status_code == 403:
-            error_data = response.json()
-            if "rate limit" in error_data.get("message", "").lower():
+        await asyncio.to_thread(_write_etag_db, url, entry)
+    except sqlite3.Error as e:
+        logger.warning(f"ETag cache write failed for {url}: {e}")
+
+def _response_from_cache(request: httpx.Request, entry: Tuple[str, Optional[str], bytes]) -> httpx.Response:
+    """Build a 200 response from a cached (etag, link header, body) entry"""
+    etag, link, body = entry
+    headers = {"ETag": etag, "Link": link} if link else {"ETag": etag}
+    return httpx.Response(200, headers=headers, content=body, request=request)
+
+async def cached_get(
+    url: str,
+    headers: Dict[str, str],
+    params: Optional[Dict] = None,
+    project: Optional[Callable[[bytes], bytes]] = None
+) -> httpx.Response:
+    """GET a GitHub API URL, revalidating any cached copy with its ETag
+    
+    A 304 Not Modified reply has no body, which saves bandwidth and
+    parsing (GitHub only exempts it from the rate limit for authorized
+    requests). It is turned into a 200 response carrying the cached body
+    and Link header, so callers handle both the same way. Cache storage
+    errors are logged and treated as a miss.
+    
+    Args:
+        url: GitHub API URL to fetch
+        headers: Request headers, e.g. authorization
+        params: Optional query parameters
+        project: Optional function reducing a 200 body to what callers need;
+            the reduced body is cached and returned in place of the original
+        
+    Returns:
+        The GitHub response, or the cached copy if it is unchanged
+    """
+    if params:
+        url = str(httpx.URL(url, params=params))
+    cached = await _get_cached_response(url)
+    if cached:
+        headers = {**headers, "If-None-Match": cached[0]}
+    
+    response = await github_client.get(url, headers=headers)
+    if response.status_code == 304 and cached:
+        return _response_from_cache(response.request, cached)
+    
+    etag = response.headers.get("ETag")
+    if response.status_code == 200 and etag:
+        entry = (etag, response.headers.get("Link"), project(response.content) if project else response.content)
+        await _store_cached_response(url, entry)
+        if project:
+            return _response_from_cache(response.request, entry)
+    return response
+
+async def cached_get_json(url: str, headers: Dict[str, str]) -> Optional[object]:
+    """GET a GitHub API URL through the ETag cache and parse its JSON body
+    
+    Args:
+        url: GitHub API URL to fetch
+        headers: Request headers, e.g. authorization
+        
+    Returns:
+        Parsed JSON body, or None if GitHub did not answer with 200 or 304
+    """
+    response = await cached_get(url, headers)
+    if response.status_code != 200:
+        return None
+    return orjson.loads(response.content)
+
+async def fetch_user_profile_graphql(username: str, github_token: str) -> List[Dict]:
+    """Fetch public repositories and their languages with a single GraphQL query
+    
+    Replaces the list-repos call plus one languages request per repository,
+    costing one rate-limit point per 100 repositories. GitHub's GraphQL API
+    requires authentication, so this is only usable with a token.
+    
+    Args:
+        username: GitHub username to fetch repositories for
+        github_token: GitHub personal access token
+        
+    Returns:
+        List of repository dictionaries in the REST API shape, each with an
+        extra 'languages' mapping of language name to bytes of code and the
+        repo's 'languages_total_size' in bytes
+        
+    Raises:
+        HTTPException: If the request fails or rate limit is exceeded
+    """
+    headers = {"Authorization": f"bearer {github_token}", "Content-Type": "application/json"}
+    repos = []
+    cursor = None
+    
+    try:
+        while True:
+            response = await github_client.post(
+                GITHUB_GRAPHQL_URL,
+                content=orjson.dumps({"query": USER_REPOS_QUERY, "variables": {"login": username, "cursor": cursor}}),
+                headers=headers
+            )
+            response.raise_for_status()
+            payload = orjson.loads(response.content)
+            
+            errors = payload.get('errors') or []
+            if any(error.get('type') == 'RATE_LIMITED' for error in errors):
                 raise HTTPException(
-                    status_code=429, 
-                    detail="GitHub API rate limit exceeded. Please try again in a few minutes or use GitHub authentication for higher limits."
+                    status_code=429,
+                    detail="GitHub API rate limit exceeded. Please try again in a few minutes."
                 )
-        response.raise_for_status()
-        return response.json()
-    except requests.exceptions.Timeout:
+            # repositoryOwner resolves both user and organization logins
+            owner = (payload.get('data') or {}).get('repositoryOwner')
+            if owner is None:
+                message = errors[0].get('message') if errors else f"User {username} not found"
+                raise HTTPException(status_code=400, detail=f"GitHub API error: {message}")
+            
+            repositories = owner['repositories']
+            for node in repositories['nodes']:
+                repos.append({
+                    'name': node['name'],
+                    'description': node['description'],
+                    'stargazers_count': node['stargazerCount'],
+                    'forks_count': node['forkCount'],
+                    'size': node['diskUsage'] or 0,
+                    'topics': [topic['topic']['name'] for topic in node['repositoryTopics']['nodes']],
+                    'languages': {edge['node']['name']: edge['size'] for edge in node['languages']['edges']},
+                    'languages_total_size': node['languages']['totalSize']
+                })
+            
+            # Only page when the user has more than 100 repositories
+            if not repositories['pageInfo']['hasNextPage']:
+                break
+            cursor = repositories['pageInfo']['endCursor']
+    except httpx.TimeoutException:
         raise HTTPException(status_code=408, detail="Request to GitHub API timed out. Please try again.")
-    except requests.exceptions.RequestException as e:
+    except httpx.HTTPError as e:
         raise HTTPException(status_code=400, detail=f"GitHub API error: {str(e)}")
+    
+    return repos
 
-def analyze_repo_languages(repos: List[Dict], github_token: Optional[str] = None) -> Dict:
+async def analyze_repo_languages(repos: List[Dict], github_token: Optional[str] = None) -> Dict:
     """Analyze programming languages from repositories
     
+    Language data for all repositories is fetched concurrently (up to
+    MAX_CONCURRENT_GITHUB_REQUESTS at a time), so the total latency is a
+    few round trips instead of one per repository.
+    
     Args:
         repos: List of repository dictionaries from GitHub API
         github_token: Optional GitHub token for authenticated requests
@@ -131,38 +472,54 @@ def analyze_repo_languages(repos: List[Dict], github_token: Optional[str] = None
         Dictionary containing language statistics, stars, forks, and repo count
     """
     language_stats = Counter()
-    total_stars = 0
-    total_forks = 0
-    total_size = 0
     
-    headers = {"User-Agent": "CommitFit/1.0"}
+    headers = {}
     if github_token:
         headers["Authorization"] = f"token {github_token}"
     
-    for repo in repos:
-        # Get language data for each repo
-        if repo.get('languages_url'):
-            try:
-                lang_response = requests.get(repo['languages_url'], headers=headers, timeout=10)
-                if lang_response.status_code == 200:
-                    repo_languages = lang_response.json()
-                    total_bytes = sum(repo_languages.values())
-                    # Normalize by percentage to avoid bias from large repos
-                    # Ensures fair representation of languages across all repositories
-                    for lang, bytes_count in repo_languages.items():
-                        if total_bytes > 0:
-                            # Normalize by percentage to weight all repos equally
-                            language_stats[lang] += bytes_count / total_bytes
-                        else:
-                            # Fallback to raw bytes if total is 0 (edge case)
-                            language_stats[lang] += bytes_count
-            except requests.exceptions.RequestException:
-                # Log but continue processing other repos
-                continue
-        
-        total_stars += repo.get('stargazers_count', 0)
-        total_forks += repo.get('forks_count', 0)
-        total_size += repo.get('size', 0)
+    # Repos from the GraphQL API already carry their languages,
+    # the rest are fetched from languages_url in parallel
+    # Each entry is a repo's {language: bytes} map and its total bytes of code
+    repo_language_maps = [
+        (repo['languages'], repo['languages_total_size']) for repo in repos if 'languages' in repo
+    ]
+    language_urls = [
+        repo['languages_url'] for repo in repos
+        if 'languages' not in repo and repo.get('languages_url')
+    ]
+    # Bound in-flight requests per analysis to respect GitHub's guidance
+    # against heavy concurrent use; unchanged repos come from the ETag cache
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_GITHUB_REQUESTS)
+    
+    async def fetch_languages(url: str) -> Optional[object]:
+        async with semaphore:
+            return await cached_get_json(url, headers)
+    
+    lang_responses = await asyncio.gather(
+        *(fetch_languages(url) for url in language_urls),
+        return_exceptions=True
+    )
+    
+    for repo_languages in lang_responses:
+        if isinstance(repo_languages, Exception):
+            # Log but continue processing other repos
+            logger.debug(f"Failed to fetch repository languages: {repo_languages}")
+            continue
+        if repo_languages is not None:
+            repo_language_maps.append((repo_languages, sum(repo_languages.values())))
+    
+    for repo_languages, total_bytes in repo_language_maps:
+        # Normalize by percentage to avoid bias from large repos
+        # Ensures fair representation of languages across all repositories
+        # Falls back to raw bytes if total is 0 (edge case)
+        divisor = total_bytes or 1
+        for lang, bytes_count in repo_languages.items():
+            language_stats[lang] += bytes_count / divisor
+    
+    # Built-in sum() reductions instead of a Python-level accumulation loop
+    total_stars = sum(repo.get('stargazers_count', 0) for repo in repos)
+    total_forks = sum(repo.get('forks_count', 0) for repo in repos)
+    total_size = sum(repo.get('size', 0) for repo in repos)
     
     # Sort languages by usage in descending order, limit to top 10
     sorted_languages = dict(language_stats.most_common(10))
@@ -179,141 +536,268 @@ def analyze_repo_languages(repos: List[Dict], github_token: Optional[str] = None
         'top_language': list(sorted_languages.keys())[0] if sorted_languages else None
     }
 
-def extract_skills_from_text(text: str) -> List[str]:
-    """Extract technical skills from job description using spaCy and keyword matching
+# Technical skill keywords, including common variations
+TECH_KEYWORDS = (
+    # Programming Languages
+    'python', 'javascript', 'java', 'c++', 'cpp', 'cplusplus', 'c#', 'csharp',
+    'typescript', 'go', 'golang', 'rust', 'swift', 'kotlin', 'scala', 'ruby',
+    'php', 'r', 'matlab', 'perl', 'lua', 'dart', 'objective-c', 'objectivec',
+    # Web Frameworks
+    'react', 'angular', 'vue', 'vue.js', 'svelte', 'next.js', 'nextjs',
+    'nuxt', 'ember', 'backbone', 'jquery',
+    # Backend Frameworks
+    'node.js', 'nodejs', 'express', 'django', 'flask', 'fastapi', 'spring',
+    'spring boot', 'laravel', 'rails', 'ruby on rails', 'asp.net', 'aspnet',
+    'nest.js', 'nestjs', 'koa', 'hapi',
+    # Databases
+    'mongodb', 'postgresql', 'postgres', 'mysql', 'sqlite', 'redis', 'cassandra',
+    'elasticsearch', 'dynamodb', 'oracle', 'sql server', 'mariadb', 'neo4j',
+    # Cloud & DevOps
+    'docker', 'kubernetes', 'k8s', 'aws', 'azure', 'gcp', 'google cloud',
+    'terraform', 'ansible', 'jenkins', 'github actions', 'gitlab ci',
+    'ci/cd', 'cicd', 'devops',
+    # Tools & Others
+    'git', 'github', 'gitlab', 'bitbucket', 'jira', 'confluence',
+    'rest api', 'graphql', 'grpc', 'microservices', 'agile', 'scrum',
+    # Data Science & ML
+    'tensorflow', 'pytorch', 'keras', 'pandas', 'numpy', 'scikit-learn',
+    'scikit learn', 'machine learning', 'ml', 'ai', 'artificial intelligence',
+    'data science', 'deep learning', 'neural networks', 'opencv',
+    # Frontend
+    'html', 'css', 'sass', 'scss', 'less', 'webpack', 'babel', 'es6',
+    'redux', 'mobx', 'zustand'
+)
+
+# Canonical skill name for keyword variations
+CANONICAL_SKILLS = {
+    'cpp': 'c++',
+    'cplusplus': 'c++',
+    'csharp': 'c#',
+    'nodejs': 'node.js',
+    'nextjs': 'next.js',
+    'nestjs': 'nest.js',
+    'vue.js': 'vue',
+    'postgres': 'postgresql',
+    'golang': 'go',
+    'scikit learn': 'scikit-learn'
+}
+
+def _is_word_char(char: str) -> bool:
+    """Return True for characters matched by \\w in a regex"""
+    return char.isalnum() or char == '_'
+
+def _build_skill_automaton() -> Optional["ahocorasick.Automaton"]:
+    """Build an Aho-Corasick automaton that finds every tech keyword in one scan
+    
+    Each keyword's payload is its length (for the word boundary check) and
+    its canonical skill name.
+    """
+    if ahocorasick is None:
+        return None
+    automaton = ahocorasick.Automaton()
+    for keyword in TECH_KEYWORDS:
+        automaton.add_word(keyword, (len(keyword), CANONICAL_SKILLS.get(keyword, keyword)))
+    automaton.make_automaton()
+    return automaton
+
+SKILL_AUTOMATON = _build_skill_automaton()
+
+# Fallback matcher: one alternation of all keywords, longest first
+# The zero-width lookahead reports a match at every word start, so keywords
+# inside longer ones ('rails' in 'ruby on rails') are still found
+SKILL_RE = re.compile(
+    r'(?<!\w)(?=('
+    + '|'.join(re.escape(keyword) for keyword in sorted(TECH_KEYWORDS, key=len, reverse=True))
+    + r')(?!\w))'
+)
+
+# Skills implied by each regex match: the keyword itself plus shorter keywords
+# it starts with ('spring' for 'spring boot'), which the alternation skips
+SKILL_RE_MATCHES = {
+    keyword: frozenset(
+        CANONICAL_SKILLS.get(prefix, prefix) for prefix in TECH_KEYWORDS
+        if keyword.startswith(prefix)
+        and (len(prefix) == len(keyword) or not _is_word_char(keyword[len(prefix)]))
+    )
+    for keyword in TECH_KEYWORDS
+}
+
+def _extract_skills(text: str) -> Tuple[str, ...]:
+    """Extract technical skills from job description using keyword matching
     
     Args:
         text: Job description or repository text to extract skills from
         
     Returns:
-        List of unique technical skills found in the text
+        Sorted tuple of unique technical skills found in the text
     """
     if not text or not text.strip():
-        return []
-    
-    # Expanded tech keywords list with variations
-        tech_keywords = [
-        # Programming Languages
-        'python', 'javascript', 'java', 'c++', 'cpp', 'cplusplus', 'c#', 'csharp',
-        'typescript', 'go', 'golang', 'rust', 'swift', 'kotlin', 'scala', 'ruby',
-        'php', 'r', 'matlab', 'perl', 'lua', 'dart', 'objective-c', 'objectivec',
-        # Web Frameworks
-        'react', 'angular', 'vue', 'vue.js', 'svelte', 'next.js', 'nextjs',
-        'nuxt', 'ember', 'backbone', 'jquery',
-        # Backend Frameworks
-        'node.js', 'nodejs', 'express', 'django', 'flask', 'fastapi', 'spring',
-        'spring boot', 'laravel', 'rails', 'ruby on rails', 'asp.net', 'aspnet',
-        'nest.js', 'nestjs', 'koa', 'hapi',
-        # Databases
-        'mongodb', 'postgresql', 'postgres', 'mysql', 'sqlite', 'redis', 'cassandra',
-        'elasticsearch', 'dynamodb', 'oracle', 'sql server', 'mariadb', 'neo4j',
-        # Cloud & DevOps
-        'docker', 'kubernetes', 'k8s', 'aws', 'azure', 'gcp', 'google cloud',
-        'terraform', 'ansible', 'jenkins', 'github actions', 'gitlab ci',
-        'ci/cd', 'cicd', 'devops',
-        # Tools & Others
-        'git', 'github', 'gitlab', 'bitbucket', 'jira', 'confluence',
-        'rest api', 'graphql', 'grpc', 'microservices', 'agile', 'scrum',
-        # Data Science & ML
-        'tensorflow', 'pytorch', 'keras', 'pandas', 'numpy', 'scikit-learn',
-        'scikit learn', 'machine learning', 'ml', 'ai', 'artificial intelligence',
-        'data science', 'deep learning', 'neural networks', 'opencv',
-        # Frontend
-        'html', 'css', 'sass', 'scss', 'less', 'webpack', 'babel', 'es6',
-        'redux', 'mobx', 'zustand'
-        ]
-        
-        found_skills = []
-        text_lower = text.lower()
-    
-    # Handle special cases with regex patterns (these have special characters)
-    # Pattern for c++ variations - handle + which is not a word character
-    cpp_patterns = [
-        r'(?<!\w)c\+\+(?!\w)',  # c++ with word boundaries (handles +)
-        r'\bcpp\b',              # cpp as whole word
-        r'\bcplusplus\b'         # cplusplus as whole word
-    ]
-    if any(re.search(pattern, text_lower, re.IGNORECASE) for pattern in cpp_patterns):
-        found_skills.append('c++')
+        return ()
+    
+    found_skills = set()
+    text_lower = text.lower()
+    
+    if SKILL_AUTOMATON is None:
+        # Single regex pass over the text
+        for keyword in set(SKILL_RE.findall(text_lower)):
+            found_skills.update(SKILL_RE_MATCHES[keyword])
+        return tuple(sorted(found_skills))
+    
+    # Single linear scan reporting every keyword occurrence
+    for end_index, (length, skill) in SKILL_AUTOMATON.iter(text_lower):
+        start_index = end_index - length + 1
+        # Only accept whole words, same as \b in a regex
+        # Also covers c++ and c#, whose symbols are not word characters
+        if start_index > 0 and _is_word_char(text_lower[start_index - 1]):
+            continue
+        if end_index + 1 < len(text_lower) and _is_word_char(text_lower[end_index + 1]):
+            continue
+        found_skills.add(skill)
     
-    # Pattern for c# variations - handle # which is not a word character
-    csharp_patterns = [
-        r'(?<!\w)c#(?!\w)',      # c# with word boundaries (handles #)
-        r'\bcsharp\b'            # csharp as whole word
-    ]
-    if any(re.search(pattern, text_lower, re.IGNORECASE) for pattern in csharp_patterns):
-        found_skills.append('c#')
+    return tuple(sorted(found_skills))
+
+# Cache of extracted skills keyed by a hash of the text, so long repository
+# texts are not kept alive as cache keys
+SKILL_CACHE_SIZE = 10000  # Maximum number of texts whose skills are cached
+skill_cache: "OrderedDict[bytes, Tuple[str, ...]]" = OrderedDict()
+
+def extract_skills_from_text(text: str) -> Tuple[str, ...]:
+    """Extract technical skills from repository text, caching results
     
-    # Check for all other keywords
-    for keyword in tech_keywords:
-        # Skip c++ and c# as we handle them with regex above
-        if keyword in ['c++', 'cpp', 'cplusplus', 'c#', 'csharp']:
-            continue
-            
-        # Use word boundaries for better matching (case-insensitive)
-        pattern = r'\b' + re.escape(keyword) + r'\b'
-        if re.search(pattern, text_lower, re.IGNORECASE):
-            # Normalize the keyword (use canonical form)
-            if keyword in ['cpp', 'cplusplus']:
-                found_skills.append('c++')
-            elif keyword in ['csharp']:
-                found_skills.append('c#')
-            elif keyword in ['nodejs', 'node.js']:
-                found_skills.append('node.js')
-            elif keyword in ['nextjs', 'next.js']:
-                found_skills.append('next.js')
-            elif keyword in ['nestjs', 'nest.js']:
-                found_skills.append('nest.js')
-            elif keyword in ['vue.js', 'vue']:
-                found_skills.append('vue')
-            elif keyword in ['postgres', 'postgresql']:
-                found_skills.append('postgresql')
-            elif keyword in ['golang', 'go']:
-                found_skills.append('go')
-            elif keyword in ['scikit learn', 'scikit-learn']:
-                found_skills.append('scikit-learn')
-            else:
-                found_skills.append(keyword)
-    
-    return list(set(found_skills))
-
-def calculate_match_score(candidate_skills: List[str], job_skills: List[str]) -> float:
-    """Calculate match score between candidate and job skills
+    Repository names, descriptions and topics often repeat between analyses,
+    so identical text is only scanned once. Long, mostly unique texts such
+    as job descriptions should call _extract_skills directly.
     
     Args:
-        candidate_skills: List of skills the candidate has
-        job_skills: List of skills required for the job
+        text: Repository text to extract skills from
         
     Returns:
-        Match score as a percentage (0-100)
+        Sorted tuple of unique technical skills found in the text
     """
-    if not job_skills:
-        return 0.0
-    if not candidate_skills:
-        return 0.0
+    key = hashlib.blake2b(text.encode(), digest_size=16).digest()
+    skills = skill_cache.get(key)
+    if skills is not None:
+        skill_cache.move_to_end(key)
+        return skills
+    
+    skills = _extract_skills(text)
+    skill_cache[key] = skills
+    if len(skill_cache) > SKILL_CACHE_SIZE:
+        skill_cache.popitem(last=False)
+    return skills
+
+# Bit position of every known skill, used to encode skill lists as int bitmasks
+# Skills outside the keyword table (e.g. GitHub language names) get the next free bit
+SKILL_INDEX: Dict[str, int] = {
+    skill: index for index, skill in enumerate(
+        dict.fromkeys(CANONICAL_SKILLS.get(keyword, keyword) for keyword in TECH_KEYWORDS)
+    )
+}
+
+def encode_skills(skills: Iterable[str]) -> int:
+    """Encode normalized skills as a bitmask with one bit per skill
     
-    candidate_skills_lower = [skill.lower().strip() for skill in candidate_skills if skill]
-    job_skills_lower = [skill.lower().strip() for skill in job_skills if skill]
+    Args:
+        skills: Lowercased, stripped skill names
+        
+    Returns:
+        Integer bitmask with the bit of each skill in SKILL_INDEX set
+    """
+    mask = 0
+    for skill in skills:
+        index = SKILL_INDEX.get(skill)
+        if index is None:
+            index = SKILL_INDEX[skill] = len(SKILL_INDEX)
+        mask |= 1 << index
+    return mask
+
+def match_score_from_masks(candidate_mask: int, job_mask: int) -> float:
+    """Calculate match score from skill bitmasks built by encode_skills
     
-    # Remove empty strings after stripping
-    candidate_skills_lower = [s for s in candidate_skills_lower if s]
-    job_skills_lower = [s for s in job_skills_lower if s]
+    Intersection is a single AND and counting matches a single popcount.
     
-    if not job_skills_lower:
+    Args:
+        candidate_mask: Bitmask of the candidate's skills
+        job_mask: Bitmask of the skills required for the job
+        
+    Returns:
+        Match score as a percentage (0-100)
+    """
+    if not job_mask:
         return 0.0
-    
-    matching = set(candidate_skills_lower) & set(job_skills_lower)
-    return round(len(matching) / len(job_skills_lower) * 100, 2)
-
-# Global storage for analysis results
-# Note: In production, consider using Redis or a database for persistence
-candidate_data = {}
-job_data = {}
+    return round((candidate_mask & job_mask).bit_count() / job_mask.bit_count() * 100, 2)
 
 # Maximum number of candidates to keep in memory (prevent memory leaks)
 MAX_CANDIDATES_IN_MEMORY = 100  # Maximum number of candidates to store in memory
 CACHE_TTL_SECONDS = 3600  # Cache candidate data for 1 hour
 
+# In-process storage for analysis results, used when Redis is not configured
+# Entries expire after CACHE_TTL_SECONDS like their Redis counterparts, and the
+# least recently used candidate is evicted once the cache is full
+candidate_data = TTLCache(maxsize=MAX_CANDIDATES_IN_MEMORY, ttl=CACHE_TTL_SECONDS)
+job_data = TTLCache(maxsize=1, ttl=CACHE_TTL_SECONDS)
+
+def _dump_record(record: Dict) -> bytes:
+    """Serialize an analysis record for Redis
+    
+    Derived skill masks and sets are left out (SKILL_INDEX bit positions
+    differ between workers), and the GitHub token is never written to
+    shared storage.
+    """
+    return orjson.dumps({
+        key: value for key, value in record.items()
+        if key not in ('skills_mask', 'skills_set', 'github_token')
+    })
+
+def _load_record(raw: str) -> Dict:
+    """Deserialize an analysis record from Redis and rebuild its derived fields"""
+    record = orjson.loads(raw)
+    record['skills_mask'] = encode_skills(record['skills'])
+    record['skills_set'] = frozenset(record['skills'])
+    return record
+
+async def save_candidate(username: str, record: Dict) -> None:
+    """Store a candidate's analysis and mark it as the most recent one"""
+    if redis_client is not None:
+        async with redis_client.pipeline() as pipe:
+            pipe.set(f"cand:{username}", _dump_record(record), ex=CACHE_TTL_SECONDS)
+            pipe.set("cand:latest", username, ex=CACHE_TTL_SECONDS)
+            await pipe.execute()
+        return
+    candidate_data[username] = record
+
+async def get_candidate(username: str) -> Optional[Dict]:
+    """Look up a stored candidate analysis by username"""
+    if redis_client is not None:
+        raw = await redis_client.get(f"cand:{username}")
+        return _load_record(raw) if raw else None
+    return candidate_data.get(username)
+
+async def get_latest_candidate_username() -> Optional[str]:
+    """Return the username of the most recently analyzed candidate"""
+    if redis_client is not None:
+        return await redis_client.get("cand:latest")
+    # TTLCache iterates in order of last write, skipping expired entries
+    usernames = list(candidate_data)
+    return usernames[-1] if usernames else None
+
+async def save_job(record: Dict) -> None:
+    """Store the current job analysis"""
+    if redis_client is not None:
+        await redis_client.set("job:current", _dump_record(record), ex=CACHE_TTL_SECONDS)
+        return
+    job_data['current_job'] = record
+
+async def get_job() -> Optional[Dict]:
+    """Look up the current job analysis"""
+    if redis_client is not None:
+        raw = await redis_client.get("job:current")
+        return _load_record(raw) if raw else None
+    return job_data.get('current_job')
+
+# GitHub usernames can only contain alphanumeric characters and hyphens
+USERNAME_RE = re.compile(r'^[a-zA-Z0-9]([a-zA-Z0-9-]*[a-zA-Z0-9])?$')
+
 @app.post("/analyze_candidate")
 async def analyze_candidate(request: GitHubAnalysisRequest):
     """Analyze GitHub candidate repositories"""
@@ -322,56 +806,47 @@ async def analyze_candidate(request: GitHubAnalysisRequest):
     if not username:
         raise HTTPException(status_code=400, detail="GitHub username is required")
     
-    # GitHub usernames can only contain alphanumeric characters and hyphens
-    if not re.match(r'^[a-zA-Z0-9]([a-zA-Z0-9-]*[a-zA-Z0-9])?$', username):
+    if not USERNAME_RE.match(username):
         raise HTTPException(status_code=400, detail="Invalid GitHub username format")
     
     try:
         username = request.github_username.strip()
         logger.info(f"Analyzing candidate: {username}")
-        repos = fetch_user_repos(username, request.github_token)
+        if request.github_token:
+            # GraphQL returns repositories and their languages in one round trip
+            repos = await fetch_user_profile_graphql(username, request.github_token)
+        else:
+            repos = await fetch_user_repos(username, request.github_token)
         logger.info(f"Found {len(repos)} repositories for {username}")
-        repo_insights = analyze_repo_languages(repos, request.github_token)
+        repo_insights = await analyze_repo_languages(repos, request.github_token)
         
         # Extract skills from repository languages and names
         # Languages are a primary indicator of technical skills
-        candidate_skills = list(repo_insights['languages'].keys())
+        # Accumulate into a set so duplicates are dropped as they are added
+        candidate_skills = {lang.strip().lower() for lang in repo_insights['languages'] if lang.strip()}
         
-        # Add skills from repository names and descriptions
-        for repo in repos:
-            repo_text = f"{repo.get('name', '')} {repo.get('description', '')}"
-            additional_skills = extract_skills_from_text(repo_text)
-            candidate_skills.extend(additional_skills)
-        
-        # Also check repository topics for additional skills
+        # Add skills from repository names, descriptions and topics
         # Topics often contain technology keywords that aren't in language stats
-        for repo in repos:
-            topics = repo.get('topics', [])
-            if topics:
-                topics_text = ' '.join(topics)
-                topic_skills = extract_skills_from_text(topics_text)
-                candidate_skills.extend(topic_skills)
-                logger.debug(f"Extracted {len(topic_skills)} skills from topics for repo {repo.get('name', 'unknown')}")
+        # Extracted skills are already lowercase canonical names
+        # All repos are scanned in one call; the \x1f separator is not a word
+        # character, so no keyword can match across two repos
+        repos_text = "\x1f".join(
+            f"{repo.get('name', '')} {repo.get('description') or ''}\x1f{' '.join(repo.get('topics') or [])}"
+            for repo in repos
+        )
+        candidate_skills.update(extract_skills_from_text(repos_text))
         
-        # Remove duplicates and empty strings, normalize
-        candidate_skills = [skill.strip().lower() for skill in candidate_skills if skill and skill.strip()]
-        candidate_skills = list(set(candidate_skills))
+        # Stored sorted once so reports can return it as-is
+        candidate_skills = sorted(candidate_skills)
         
-        candidate_data[username] = {
+        await save_candidate(username, {
             'skills': candidate_skills,
+            'skills_mask': encode_skills(candidate_skills),
+            'skills_set': frozenset(candidate_skills),
             'repo_insights': repo_insights
-        }
-        
-    # Clean up old candidates if we exceed the limit (FIFO)
-    # This prevents memory leaks in long-running services
-    # Ensures predictable memory usage in production environments
-    if len(candidate_data) > MAX_CANDIDATES_IN_MEMORY:
-        oldest_key = next(iter(candidate_data))
-        del candidate_data[oldest_key]
-        logger.info(f"Memory limit reached, removed oldest candidate {oldest_key} from memory")
+        })
         
         logger.info(f"Stored data for {username} with {len(candidate_skills)} skills")
-        logger.debug(f"Current candidates in memory: {list(candidate_data.keys())}")
         logger.debug(f"Top 5 skills: {candidate_skills[:5]}")
         
         return {
@@ -406,20 +881,16 @@ async def analyze_job(request: JobAnalysisRequest):
     
     try:
         job_desc = request.job_description.strip()
-        job_skills = extract_skills_from_text(job_desc)
-        
-        # Normalize job skills: lowercase, strip whitespace, remove empty strings
-        job_skills = [skill.strip().lower() for skill in job_skills if skill and skill.strip()]
-        job_skills = list(set(job_skills))
+        # Extracted skills are already unique, lowercase canonical names, sorted
+        # Job descriptions are rarely repeated, so the extraction cache is bypassed
+        job_skills = list(_extract_skills(job_desc))
         
-        # Sort for consistent output
-        job_skills.sort()
-        
-        job_data['current_job'] = {
+        await save_job({
             'skills': job_skills,
+            'skills_mask': encode_skills(job_skills),
             'description': request.job_description,
             'github_token': request.github_token
-        }
+        })
         
         logger.info(f"Extracted {len(job_skills)} unique skills from job description")
         if job_skills:
@@ -441,27 +912,22 @@ async def analyze_job(request: JobAnalysisRequest):
 async def get_match_report(username: Optional[str] = None):
     """Get match report between candidate and job"""
     logger.info(f"Match report requested for username: {username}")
-    logger.debug(f"Candidates in memory: {list(candidate_data.keys())}")
-    logger.debug(f"Job data exists: {bool(job_data)}")
+    current_job = await get_job()
+    logger.debug(f"Job data exists: {current_job is not None}")
     
-    if not job_data:
+    if not current_job:
         raise HTTPException(status_code=400, detail="Please analyze job description first")
     
     # Use provided username or get the most recent candidate
-    if username and username in candidate_data:
-        latest_candidate = candidate_data[username]
-        latest_candidate_username = username
-    elif candidate_data:
+    latest_candidate = await get_candidate(username) if username else None
+    latest_candidate_username = username
+    if latest_candidate is None:
         # Fallback to most recent candidate
-        latest_candidate_username = list(candidate_data.keys())[-1]
-        latest_candidate = candidate_data[latest_candidate_username]
+        latest_candidate_username = await get_latest_candidate_username()
+        latest_candidate = await get_candidate(latest_candidate_username) if latest_candidate_username else None
+        if latest_candidate is None:
+            raise HTTPException(status_code=400, detail="Please analyze candidate first")
         logger.warning(f"Username not provided or not found, using most recent: {latest_candidate_username}")
-    else:
-        raise HTTPException(status_code=400, detail="Please analyze candidate first")
-    
-    current_job = job_data.get('current_job')
-    if not current_job:
-        raise HTTPException(status_code=400, detail="Job data not found. Please analyze job description again.")
     
     logger.info(f"Using candidate: {latest_candidate_username}")
     logger.debug(f"Candidate skills count: {len(latest_candidate.get('skills', []))}")
@@ -477,42 +943,25 @@ async def get_match_report(username: Optional[str] = None):
     if not job_skills:
         logger.warning("No job skills found")
     
-    match_score = calculate_match_score(candidate_skills, job_skills)
+    match_score = match_score_from_masks(latest_candidate['skills_mask'], current_job['skills_mask'])
     logger.info(f"Match score calculated: {match_score}%")
     
-    # Skills are already normalized to lowercase
-    candidate_skills_lower = [skill.lower().strip() for skill in candidate_skills if skill]
-    job_skills_lower = [skill.lower().strip() for skill in job_skills if skill]
-    
-    # Remove empty strings
-    candidate_skills_lower = [s for s in candidate_skills_lower if s]
-    job_skills_lower = [s for s in job_skills_lower if s]
-    
-    matching_skills = list(set(candidate_skills_lower) & set(job_skills_lower))
-    missing_skills = list(set(job_skills_lower) - set(candidate_skills_lower))
-    
-    # Sort for consistent output and better UX
-    # Alphabetical sorting makes it easier to scan the results
-    matching_skills.sort()
-    missing_skills.sort()
-    
-    # Calculate additional metrics for logging and future features
-    match_percentage = round((len(matching_skills) / len(job_skills_lower) * 100), 2) if job_skills_lower else 0
+    # Stored skills are already lowercase, stripped, non-empty, unique and sorted
+    # Filtering the sorted job skills keeps both lists in alphabetical order,
+    # which makes it easier to scan the results
+    candidate_skill_set = latest_candidate['skills_set']
+    matching_skills = [skill for skill in job_skills if skill in candidate_skill_set]
+    missing_skills = [skill for skill in job_skills if skill not in candidate_skill_set]
     
     logger.debug(f"Found {len(matching_skills)} matching skills and {len(missing_skills)} missing skills")
-    logger.debug(f"Match percentage: {match_percentage}%")
-    
-    # Ensure all lists are properly formatted and deduplicated
-    unique_candidate_skills = sorted(list(set(candidate_skills)))
-    unique_job_skills = sorted(list(set(job_skills)))
     
     return MatchReport(
         username=latest_candidate_username,
         match_score=round(match_score, 2),
         matching_skills=matching_skills,
         missing_skills=missing_skills,
-        candidate_skills=unique_candidate_skills,
-        job_skills=unique_job_skills,
+        candidate_skills=candidate_skills,
+        job_skills=job_skills,
         repo_insights=latest_candidate.get('repo_insights', {})
     )
 
@@ -541,9 +990,11 @@ async def health_check():
     import time
     return {
         "status": "healthy",
-        "spacy_loaded": nlp is not None,
+        # Only report a model that was already loaded; don't load it here
+        "spacy_loaded": _get_nlp.cache_info().currsize > 0 and _get_nlp() is not None,
+        "storage": "redis" if redis_client is not None else "memory",
         "candidates_in_memory": len(candidate_data),
-        "job_data_exists": bool(job_data),
+        "job_data_exists": await get_job() is not None,
         "memory_usage_percent": round((len(candidate_data) / MAX_CANDIDATES_IN_MEMORY) * 100, 2) if MAX_CANDIDATES_IN_MEMORY > 0 else 0,
         "timestamp": time.time()
     }